@@ -171,20 +171,19 @@ class MultiUnitModelCostingBlockData(UnitModelCostingBlockData, UnitModelCosting
         # Now we need to tie them all together
         cost_vars = list(DefaultCostingComponents) + ["direct_capital_cost"]
         for vname in cost_vars:
-            for blk in self.costing_blocks.values():
-                if hasattr(blk, vname):
-                    break
-            else:  # no break
-                continue
-
+            # single pass over the costing blocks; only create the
+            # selector Expression if some block has this component
             expr = 0.0
+            found = False
             for name, blk in self.costing_blocks.items():
                 cvar = blk.component(vname)
                 if cvar is None:
                     continue
+                found = True
                 expr += self.costing_block_selector[name] * cvar
 
-            self.add_component(vname, pyo.Expression(expr=expr))
+            if found:
+                self.add_component(vname, pyo.Expression(expr=expr))
 
     def select_costing_block(self, costing_block_name):
         """
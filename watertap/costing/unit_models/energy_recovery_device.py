@@ -37,7 +37,7 @@ def cost_energy_recovery_device(
             be converted to kW and costed as an electricity. Defaults to True.
     """
     if energy_recovery_device_type == EnergyRecoveryDeviceType.pressure_exchanger:
-        cost_pressure_exchanger_erd(blk)
+        cost_pressure_exchanger_erd(blk, cost_electricity_flow)
     else:
         raise ConfigurationError(
             f"{blk.unit_model.name} received invalid argument for energy_recovery_device_type:"
@@ -18,84 +18,71 @@ from ..util import (
 )
 
 
-def build_hcl_cost_param_block(blk):
-
+def _build_regenerant_cost_param_block(blk, flow_type, cost, purity, cost_units):
+    """
+    Shared builder for the regeneration chemical parameter blocks: a
+    mutable cost and purity Param plus registration of the costed flow.
+    """
     blk.cost = pyo.Param(
         mutable=True,
-        initialize=0.17,
-        doc="HCl cost",  # for 37% sol'n - CatCost v 1.0.4
-        units=pyo.units.USD_2020 / pyo.units.kg,
+        initialize=cost,
+        doc=f"{flow_type} cost",
+        units=cost_units,
     )
     blk.purity = pyo.Param(
         mutable=True,
-        initialize=0.37,
-        doc="HCl purity",
+        initialize=purity,
+        doc=f"{flow_type} purity",
         units=pyo.units.dimensionless,
     )
 
     costing = blk.parent_block()
-    costing.register_flow_type("HCl", blk.cost / blk.purity)
-
+    costing.register_flow_type(flow_type, blk.cost / blk.purity)
 
-def build_naoh_cost_param_block(blk):
 
-    blk.cost = pyo.Param(
-        mutable=True,
-        initialize=0.59,
-        doc="NaOH cost",  # for 30% sol'n - iDST
-        units=pyo.units.USD_2020 / pyo.units.kg,
+def build_hcl_cost_param_block(blk):
+    # cost for 37% sol'n - CatCost v 1.0.4
+    _build_regenerant_cost_param_block(
+        blk,
+        "HCl",
+        cost=0.17,
+        purity=0.37,
+        cost_units=pyo.units.USD_2020 / pyo.units.kg,
     )
 
-    blk.purity = pyo.Param(
-        mutable=True,
-        initialize=0.30,
-        doc="NaOH purity",
-        units=pyo.units.dimensionless,
-    )
 
-    costing = blk.parent_block()
-    costing.register_flow_type("NaOH", blk.cost / blk.purity)
+def build_naoh_cost_param_block(blk):
+    # cost for 30% sol'n - iDST
+    _build_regenerant_cost_param_block(
+        blk,
+        "NaOH",
+        cost=0.59,
+        purity=0.30,
+        cost_units=pyo.units.USD_2020 / pyo.units.kg,
+    )
 
 
 def build_meoh_cost_param_block(blk):
-    # MeOH = Methanol
-    blk.cost = pyo.Param(
-        mutable=True,
-        initialize=3.395,
-        doc="MeOH cost",  # for 100% purity - ICIS
-        units=pyo.units.USD_2008 / pyo.units.kg,
+    # MeOH = Methanol, cost for 100% purity - ICIS
+    _build_regenerant_cost_param_block(
+        blk,
+        "MeOH",
+        cost=3.395,
+        purity=1,
+        cost_units=pyo.units.USD_2008 / pyo.units.kg,
     )
 
-    blk.purity = pyo.Param(
-        mutable=True,
-        initialize=1,
-        doc="MeOH purity",
-        units=pyo.units.dimensionless,
-    )
-
-    costing = blk.parent_block()
-    costing.register_flow_type("MeOH", blk.cost / blk.purity)
-
 
 def build_nacl_cost_param_block(blk):
-
-    blk.cost = pyo.Param(
-        mutable=True,
-        initialize=0.09,
-        doc="NaCl cost",  # for solid, 100% purity - CatCost
-        units=pyo.units.USD_2020 / pyo.units.kg,
+    # cost for solid, 100% purity - CatCost
+    _build_regenerant_cost_param_block(
+        blk,
+        "NaCl",
+        cost=0.09,
+        purity=1,
+        cost_units=pyo.units.USD_2020 / pyo.units.kg,
     )
 
-    blk.purity = pyo.Param(
-        mutable=True,
-        initialize=1,
-        doc="NaCl purity",
-        units=pyo.units.dimensionless,
-    )
-
-    costing = blk.parent_block()
-    costing.register_flow_type("NaCl", blk.cost / blk.purity)
-
 
 def build_ion_exhange_cost_param_block(blk):
     blk.anion_exchange_resin_cost = pyo.Var(
@@ -202,6 +189,8 @@ def cost_ion_exchange(blk):
     make_capital_cost_var(blk)
     make_fixed_operating_cost_var(blk)
     ion_exchange_params = blk.costing_package.ion_exchange
+    c_units = blk.costing_package.base_currency
+    t_units = blk.costing_package.base_period
     # Conversions to use units from cost equations in reference
     tot_num_col = blk.unit_model.number_columns + blk.unit_model.number_columns_redund
     col_vol_gal = pyo.units.convert(blk.unit_model.col_vol_per, to_units=pyo.units.gal)
@@ -223,31 +212,31 @@ def cost_ion_exchange(blk):
     blk.capital_cost_vessel = pyo.Var(
         initialize=1e5,
         domain=pyo.NonNegativeReals,
-        units=blk.costing_package.base_currency,
+        units=c_units,
         doc="Capital cost for one vessel",
     )
     blk.capital_cost_resin = pyo.Var(
         initialize=1e5,
         domain=pyo.NonNegativeReals,
-        units=blk.costing_package.base_currency,
+        units=c_units,
         doc="Capital cost for resin for one vessel",
     )
     blk.capital_cost_regen_tank = pyo.Var(
         initialize=1e5,
         domain=pyo.NonNegativeReals,
-        units=blk.costing_package.base_currency,
+        units=c_units,
         doc="Capital cost for regeneration solution tank",
     )
     blk.capital_cost_backwash_tank = pyo.Var(
         initialize=1e5,
         domain=pyo.NonNegativeReals,
-        units=blk.costing_package.base_currency,
+        units=c_units,
         doc="Capital cost for backwash + rinse solution tank",
     )
     blk.operating_cost_hazardous = pyo.Var(
         initialize=1e5,
         domain=pyo.NonNegativeReals,
-        units=blk.costing_package.base_currency / blk.costing_package.base_period,
+        units=c_units / t_units,
         doc="Operating cost for hazardous waste disposal",
     )
     blk.flow_mass_regen_soln = pyo.Var(
@@ -276,14 +265,12 @@ def cost_ion_exchange(blk):
                 ion_exchange_params.vessel_A_coeff
                 * (col_vol_gal / pyo.units.gallon) ** ion_exchange_params.vessel_b_coeff
             ),
-            to_units=blk.costing_package.base_currency,
+            to_units=c_units,
         )
     )
     blk.capital_cost_resin_constraint = pyo.Constraint(
         expr=blk.capital_cost_resin
-        == pyo.units.convert(
-            resin_cost * bed_vol_ft3, to_units=blk.costing_package.base_currency
-        )
+        == pyo.units.convert(resin_cost * bed_vol_ft3, to_units=c_units)
     )
     if blk.unit_model.config.regenerant == "single_use":
         blk.capital_cost_regen_tank.fix(0)
@@ -291,13 +278,13 @@ def cost_ion_exchange(blk):
         blk.flow_vol_resin = pyo.Var(
             initialize=1e5,
             bounds=(0, None),
-            units=pyo.units.m**3 / blk.costing_package.base_period,
+            units=pyo.units.m**3 / t_units,
             doc="Volumetric flow of resin per cycle",  # assumes you are only replacing the operational columns, t_cycle = t_breakthru
         )
         blk.single_use_resin_replacement_cost = pyo.Var(
             initialize=1e5,
             bounds=(0, None),
-            units=blk.costing_package.base_currency / blk.costing_package.base_period,
+            units=c_units / t_units,
             doc="Operating cost for using single-use resin (i.e., no regeneration)",
         )
 
@@ -305,12 +292,12 @@ def cost_ion_exchange(blk):
             expr=blk.flow_vol_resin
             == pyo.units.convert(
                 blk.unit_model.bed_vol_tot / blk.unit_model.t_breakthru,
-                to_units=pyo.units.m**3 / blk.costing_package.base_period,
+                to_units=pyo.units.m**3 / t_units,
             )
         )
         blk.mass_flow_resin = pyo.units.convert(
             blk.flow_vol_resin * blk.unit_model.resin_bulk_dens,
-            to_units=pyo.units.ton / blk.costing_package.base_period,
+            to_units=pyo.units.ton / t_units,
         )
     else:
 
@@ -327,7 +314,7 @@ def cost_ion_exchange(blk):
                 ion_exchange_params.regen_tank_A_coeff
                 * (blk.regeneration_tank_vol / pyo.units.gallon)
                 ** ion_exchange_params.regen_tank_b_coeff,
-                to_units=blk.costing_package.base_currency,
+                to_units=c_units,
             )
         )
 
@@ -347,7 +334,7 @@ def cost_ion_exchange(blk):
             ion_exchange_params.backwash_tank_A_coeff
             * (blk.backwash_tank_vol / pyo.units.gallon)
             ** ion_exchange_params.backwash_tank_b_coeff,
-            to_units=blk.costing_package.base_currency,
+            to_units=c_units,
         )
     )
 
@@ -361,7 +348,7 @@ def cost_ion_exchange(blk):
                 + blk.capital_cost_backwash_tank
                 + blk.capital_cost_regen_tank
             ),
-            to_units=blk.costing_package.base_currency,
+            to_units=c_units,
         )
     )
     if blk.unit_model.config.hazardous_waste:
@@ -372,8 +359,7 @@ def cost_ion_exchange(blk):
                 == pyo.units.convert(
                     (blk.mass_flow_resin * ion_exchange_params.hazardous_resin_disposal)
                     + ion_exchange_params.hazardous_min_cost,
-                    to_units=blk.costing_package.base_currency
-                    / blk.costing_package.base_period,
+                    to_units=c_units / t_units,
                 )
             )
         else:
@@ -396,8 +382,7 @@ def cost_ion_exchange(blk):
                     )
                     * ion_exchange_params.hazardous_regen_disposal
                     + ion_exchange_params.hazardous_min_cost,
-                    to_units=blk.costing_package.base_currency
-                    / blk.costing_package.base_period,
+                    to_units=c_units / t_units,
                 )
             )
     else:
@@ -408,8 +393,7 @@ def cost_ion_exchange(blk):
             expr=blk.single_use_resin_replacement_cost
             == pyo.units.convert(
                 blk.flow_vol_resin * resin_cost,
-                to_units=blk.costing_package.base_currency
-                / blk.costing_package.base_period,
+                to_units=c_units / t_units,
             )
         )
 
@@ -430,8 +414,7 @@ def cost_ion_exchange(blk):
                         * resin_cost
                     )
                 ),
-                to_units=blk.costing_package.base_currency
-                / blk.costing_package.base_period,
+                to_units=c_units / t_units,
             )
             + blk.operating_cost_hazardous
         )
@@ -43,17 +43,14 @@ def cost_mixer(blk, mixer_type=MixerType.default, **kwargs):
             and CaOH2 mixers expect the `dosing_rate` keyword
             argument.
     """
-    if mixer_type == MixerType.default:
-        cost_default_mixer(blk, **kwargs)
-    elif mixer_type == MixerType.NaOCl:
-        cost_naocl_mixer(blk, **kwargs)
-    elif mixer_type == MixerType.CaOH2:
-        cost_caoh2_mixer(blk, **kwargs)
-    else:
+    try:
+        costing_method = _mixer_costing_methods[mixer_type]
+    except KeyError:
         raise ConfigurationError(
             f"{blk.unit_model.name} received invalid argument for mixer_type:"
             f" {mixer_type}. Argument must be a member of the MixerType Enum."
         )
+    costing_method(blk, **kwargs)
 
 
 @register_costing_parameter_block(
@@ -175,7 +172,6 @@ def cost_caoh2_mixer(blk, dosing_rate):
     Args:
         dosing_rate: An expression in [mass/time] for CaOH2 dosage
     """
-    stream = blk.unit_model.lime_stream
     blk.lime_kg_per_day = pyo.Expression(
         expr=pyo.units.convert(
             dosing_rate,
@@ -190,3 +186,11 @@ def cost_caoh2_mixer(blk, dosing_rate):
     blk.costing_package.cost_flow(
         pyo.units.convert(dosing_rate, pyo.units.kg / pyo.units.s), "CaOH2"
     )
+
+
+# Costing method to use for each member of the MixerType Enum
+_mixer_costing_methods = {
+    MixerType.default: cost_default_mixer,
+    MixerType.NaOCl: cost_naocl_mixer,
+    MixerType.CaOH2: cost_caoh2_mixer,
+}
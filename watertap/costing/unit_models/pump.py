@@ -25,6 +25,22 @@ class PumpType(StrEnum):
     high_pressure = "high_pressure"
 
 
+def _cost_work_as_electricity_flow(blk, t0):
+    """
+    Cost the pump's mechanical work at t0 as an electricity flow.
+    """
+    # grab lower bound of mechanical work
+    lb = blk.unit_model.work_mechanical[t0].lb
+    # set lower bound to 0 to avoid negative defined flow warning when lb is not >= 0
+    blk.unit_model.work_mechanical.setlb(0)
+    blk.costing_package.cost_flow(
+        pyo.units.convert(blk.unit_model.work_mechanical[t0], to_units=pyo.units.kW),
+        "electricity",
+    )
+    # set lower bound back to its original value that was assigned to lb
+    blk.unit_model.work_mechanical.setlb(lb)
+
+
 def cost_pump(blk, pump_type=PumpType.high_pressure, cost_electricity_flow=True):
     """
     Pump costing method
@@ -86,18 +102,7 @@ def cost_high_pressure_pump(blk, cost_electricity_flow=True):
         )
     )
     if cost_electricity_flow:
-        # grab lower bound of mechanical work
-        lb = blk.unit_model.work_mechanical[t0].lb
-        # set lower bound to 0 to avoid negative defined flow warning when lb is not >= 0
-        blk.unit_model.work_mechanical.setlb(0)
-        blk.costing_package.cost_flow(
-            pyo.units.convert(
-                blk.unit_model.work_mechanical[t0], to_units=pyo.units.kW
-            ),
-            "electricity",
-        )
-        # set lower bound back to its original value that was assigned to lb
-        blk.unit_model.work_mechanical.setlb(lb)
+        _cost_work_as_electricity_flow(blk, t0)
 
 
 def build_low_pressure_pump_cost_param_block(blk):
@@ -133,15 +138,4 @@ def cost_low_pressure_pump(blk, cost_electricity_flow=True):
         ),
     )
     if cost_electricity_flow:
-        # grab lower bound of mechanical work
-        lb = blk.unit_model.work_mechanical[t0].lb
-        # set lower bound to 0 to avoid negative defined flow warning when lb is not >= 0
-        blk.unit_model.work_mechanical.setlb(0)
-        blk.costing_package.cost_flow(
-            pyo.units.convert(
-                blk.unit_model.work_mechanical[t0], to_units=pyo.units.kW
-            ),
-            "electricity",
-        )
-        # set lower bound back to its original value that was assigned to lb
-        blk.unit_model.work_mechanical.setlb(lb)
+        _cost_work_as_electricity_flow(blk, t0)
@@ -55,18 +55,19 @@ def cost_reverse_osmosis(blk, ro_type=ROType.standard):
             default = ROType.standard
     """
     if ro_type == ROType.standard:
-        return cost_membrane(
-            blk,
-            blk.costing_package.reverse_osmosis.membrane_cost,
-            blk.costing_package.reverse_osmosis.factor_membrane_replacement,
-        )
+        membrane_cost = blk.costing_package.reverse_osmosis.membrane_cost
     elif ro_type == ROType.high_pressure:
-        return cost_high_pressure_reverse_osmosis(blk)
+        membrane_cost = blk.costing_package.reverse_osmosis.high_pressure_membrane_cost
     else:
         raise ConfigurationError(
             f"{blk.unit_model.name} received invalid argument for ro_type:"
             f" {ro_type}. Argument must be a member of the ROType Enum."
         )
+    return cost_membrane(
+        blk,
+        membrane_cost,
+        blk.costing_package.reverse_osmosis.factor_membrane_replacement,
+    )
 
 
 @register_costing_parameter_block(
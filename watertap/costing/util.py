@@ -189,10 +189,10 @@ def cost_rectifier(blk, power=100 * pyo.units.kW, ac_dc_conversion_efficiency=0.
     )
 
     # USD_2021 embedded in equation
-    rectifier_cost_coeff = {0: 508.6, 1: 2810}
-    blk.rectifier_cost_coeff = pyo.Var(
-        rectifier_cost_coeff.keys(),
-        initialize=rectifier_cost_coeff,
+    blk.rectifier_cost_coeff = pyo.Param(
+        [0, 1],
+        initialize={0: 508.6, 1: 2810},
+        mutable=True,
         units=pyo.units.dimensionless,
         doc="Rectifier cost coefficients",
     )
@@ -200,10 +200,6 @@ def cost_rectifier(blk, power=100 * pyo.units.kW, ac_dc_conversion_efficiency=0.
         initialize=100, units=blk.costing_package.base_currency
     )
 
-    # refix variables to appropriate costing parameters
-    for index, var in blk.rectifier_cost_coeff.items():
-        var.fix(rectifier_cost_coeff[index])
-
     # calculate capital cost
     blk.capital_cost_rectifier_constraint = pyo.Constraint(
         expr=blk.capital_cost_rectifier
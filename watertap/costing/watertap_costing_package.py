@@ -12,6 +12,7 @@
 
 import pyomo.environ as pyo
 
+from pyomo.core.expr.numeric_expr import LinearExpression
 from pyomo.util.calc_var_value import calculate_variable_from_constraint
 from idaes.core.base.costing_base import register_idaes_currency_units
 
@@ -26,6 +27,11 @@ from watertap.costing.unit_models.heat_exchanger import cost_heat_exchanger
 from watertap.costing.unit_models.cstr import cost_cstr
 from watertap.costing.unit_models.heater_chiller import cost_heater_chiller
 
+# The detailed fixed-cost factors below sum (with benefits at 90% of
+# salaries) to 0.0149/year; scale them so their total matches the default
+# 0.03/year maintenance-labor-chemical factor.
+_MLC_FACTOR_SCALING = 0.03 / 0.0149
+
 
 class WaterTAPCostingBlockData(FlowsheetCostingBlockData):
     """
@@ -193,7 +199,15 @@ class WaterTAPCostingBlockData(FlowsheetCostingBlockData):
             expr=(
                 (
                     self.aggregate_variable_operating_cost
-                    + sum(self.aggregate_flow_costs[f] for f in self.used_flows)
+                    # build the sum over flow costs as a single flat
+                    # LinearExpression instead of a nested SumExpression
+                    + LinearExpression(
+                        constant=0,
+                        linear_coefs=[1] * len(self.used_flows),
+                        linear_vars=[
+                            self.aggregate_flow_costs[f] for f in self.used_flows
+                        ],
+                    )
                     * self.utilization_factor
                 )
                 if self.used_flows
@@ -462,7 +476,7 @@ class WaterTAPCostingDetailedData(WaterTAPCostingBlockData):
         self.salaries_percent_FCI = pyo.Var(
             units=1 / self.base_period,
             doc="Salaries as % FCI",
-            initialize=0.001 * (0.03 / 0.0149),
+            initialize=0.001 * _MLC_FACTOR_SCALING,
         )
         self.benefit_percent_of_salary = pyo.Var(
             units=pyo.units.dimensionless,
@@ -472,17 +486,17 @@ class WaterTAPCostingDetailedData(WaterTAPCostingBlockData):
         self.maintenance_costs_percent_FCI = pyo.Var(
             units=1 / self.base_period,
             doc="Maintenance and contingency costs as % FCI",
-            initialize=0.008 * (0.03 / 0.0149),
+            initialize=0.008 * _MLC_FACTOR_SCALING,
         )
         self.laboratory_fees_percent_FCI = pyo.Var(
             units=1 / self.base_period,
             doc="Laboratory fees as % FCI",
-            initialize=0.003 * (0.03 / 0.0149),
+            initialize=0.003 * _MLC_FACTOR_SCALING,
         )
         self.insurance_and_taxes_percent_FCI = pyo.Var(
             units=1 / self.base_period,
             doc="Insurance and taxes as % FCI",
-            initialize=0.002 * (0.03 / 0.0149),
+            initialize=0.002 * _MLC_FACTOR_SCALING,
         )
 
         self.total_investment_factor = pyo.Expression(
@@ -39,6 +39,9 @@ global_params = [
     "TIC",
 ]
 
+# currency definitions already loaded into the units registry
+_registered_currency_definitions = set()
+
 
 @declare_process_block_class("ZeroOrderCosting")
 class ZeroOrderCostingData(WaterTAPCostingDetailedData):
@@ -59,9 +62,13 @@ class ZeroOrderCostingData(WaterTAPCostingDetailedData):
     def register_currency_definitions(self):
         # Register currency and conversion rates
         if "currency_definitions" in self._cs_def:
-            pyo.units.load_definitions_from_strings(
-                self._cs_def["currency_definitions"]
-            )
+            definitions = tuple(self._cs_def["currency_definitions"])
+            # only load each set of definitions into the units registry
+            # once -- loading them again when another costing block is
+            # built would redefine the same currency units
+            if definitions not in _registered_currency_definitions:
+                pyo.units.load_definitions_from_strings(definitions)
+                _registered_currency_definitions.add(definitions)
         else:
             register_idaes_currency_units()
 
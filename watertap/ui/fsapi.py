@@ -21,6 +21,8 @@ from csv import reader, writer
 from enum import Enum
 from io import TextIOBase
 
+import importlib
+
 try:
     from importlib.resources import files
 except ImportError:
@@ -399,13 +401,13 @@ class FlowsheetExport(BaseModel):
             _log.debug(
                 f"Reading CSV data for interface exports from " f"absolute path: {path}"
             )
-            text = open(path, "r", encoding="utf-8").read()
+            text = path.read_text(encoding="utf-8")
         else:
             caller = inspect.getouterframes(inspect.currentframe())[1]
             caller_mod = inspect.getmodule(caller.frame).__name__
             if "." not in caller_mod:  # not in a package
                 path = Path(caller.filename).parent / file
-                text = open(path, "r", encoding="utf-8").read()
+                text = path.read_text(encoding="utf-8")
             else:
                 caller_pkg = ".".join(caller_mod.split(".")[:-1])  # strip module
                 _log.debug(
@@ -483,13 +485,13 @@ class FlowsheetExport(BaseModel):
         Raises:
             IOError: If path is given, and not writable
         """
-        # open file for writing
+        # write to the stream directly, or open (and later close) the given path
         if isinstance(output, TextIOBase):
-            output_file = output
-        else:
-            p = Path(output)
-            output_file = p.open("w")
+            return self._write_csv(output)
+        with Path(output).open("w") as output_file:
+            return self._write_csv(output_file)
 
+    def _write_csv(self, output_file) -> int:
         # initialize
         csv_output_file = writer(output_file)
 
@@ -733,13 +735,10 @@ class FlowsheetInterface:
             if dst.is_input and not dst.is_readonly:
                 # only update if value has changed
                 if dst.value != src.value:
-                    # print(f'changing value for {key} from {dst.value} to {src.value}')
-                    # create a Var so Pyomo can do the unit conversion for us
-                    tmp = pyo.Var(initialize=src.value, units=ui_units)
-                    tmp.construct()
                     # Convert units when setting value in the model
-                    new_val = pyo.value(u.convert(tmp, to_units=u.get_units(dst.obj)))
-                    # print(f'changing value for {key} from {dst.value} to {new_val}')
+                    new_val = u.convert_value(
+                        src.value, from_units=ui_units, to_units=u.get_units(dst.obj)
+                    )
                     dst.obj.set_value(new_val)
                     # Don't convert units when setting the exported value
                     dst.value = src.value
@@ -760,10 +759,10 @@ class FlowsheetInterface:
                             dst.obj.setlb(None)
                             dst.lb = None
                         else:
-                            tmp = pyo.Var(initialize=src.lb, units=ui_units)
-                            tmp.construct()
-                            new_lb = pyo.value(
-                                u.convert(tmp, to_units=u.get_units(dst.obj))
+                            new_lb = u.convert_value(
+                                src.lb,
+                                from_units=ui_units,
+                                to_units=u.get_units(dst.obj),
                             )
                             dst.obj.setlb(new_lb)
                             dst.lb = src.lb
@@ -773,12 +772,11 @@ class FlowsheetInterface:
                             dst.obj.setub(None)
                             dst.ub = None
                         else:
-                            tmp = pyo.Var(initialize=src.ub, units=ui_units)
-                            tmp.construct()
-                            new_ub = pyo.value(
-                                u.convert(tmp, to_units=u.get_units(dst.obj))
+                            new_ub = u.convert_value(
+                                src.ub,
+                                from_units=ui_units,
+                                to_units=u.get_units(dst.obj),
                             )
-                            # print(f'changing ub for {key} from {dst.obj.ub} to {new_ub}')
                             dst.obj.setub(new_ub)
                             dst.ub = src.ub
 
@@ -914,18 +912,19 @@ class FlowsheetInterface:
             # print(f'{key} is being set to: {mo.value}')
             if hasattr(mo.obj, "bounds"):
                 # print(f'{key} is being set to: {mo.value} from {mo.obj.value}')
+                obj_units = u.get_units(mo.obj)
                 if mo.obj.ub is None:
                     mo.ub = mo.obj.ub
                 else:
-                    tmp = pyo.Var(initialize=mo.obj.ub, units=u.get_units(mo.obj))
-                    tmp.construct()
-                    mo.ub = pyo.value(u.convert(tmp, to_units=mo.ui_units))
+                    mo.ub = u.convert_value(
+                        mo.obj.ub, from_units=obj_units, to_units=mo.ui_units
+                    )
                 if mo.obj.lb is None:
                     mo.lb = mo.obj.lb
                 else:
-                    tmp = pyo.Var(initialize=mo.obj.lb, units=u.get_units(mo.obj))
-                    tmp.construct()
-                    mo.lb = pyo.value(u.convert(tmp, to_units=mo.ui_units))
+                    mo.lb = u.convert_value(
+                        mo.obj.lb, from_units=obj_units, to_units=mo.ui_units
+                    )
                 mo.fixed = mo.obj.fixed
             else:
                 mo.has_bounds = False
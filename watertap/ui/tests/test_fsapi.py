@@ -213,37 +213,18 @@ class CSVTestSettings:
     bad_units = False
 
 
-@pytest.mark.unit
-def test_csv_exports():
-    for i in range(3):
-        if i == 1:
-            CSVTestSettings.bad_obj, CSVTestSettings.bad_units = True, False
-        elif i == 2:
-            CSVTestSettings.bad_obj, CSVTestSettings.bad_units = False, True
-        else:
-            CSVTestSettings.bad_obj, CSVTestSettings.bad_units = False, False
-        for export_func in (csv_from_tempfile, csv_from_localfile):
-            fsi = fsapi.FlowsheetInterface(
-                do_build=build_ro, do_solve=solve_ro, do_export=export_func
-            )
-            if i == 0:
-                fsi.build()  # expect success
-            else:
-                # expect failure (bad_units or bad_obj)
-                with pytest.raises(RuntimeError):
-                    fsi.build()
-
-
 def csv_from_tempfile(exports=None, flowsheet=None, **kwargs):
     with tempfile.TemporaryDirectory() as tempdir:
         f = Path(tempdir) / "fake.csv"
-        populate_csv_exports(f.open("w"))
+        with f.open("w") as fp:
+            populate_csv_exports(fp)
         exports.from_csv(file=f, flowsheet=flowsheet)
 
 
 def csv_from_localfile(exports=None, flowsheet=None, **kwargs):
     path = Path(__file__).parent / "test.csv"
-    populate_csv_exports(path.open("w"))
+    with path.open("w") as fp:
+        populate_csv_exports(fp)
     try:
         exports.from_csv(file="test.csv", flowsheet=flowsheet)
     finally:
@@ -257,9 +238,26 @@ def populate_csv_exports(f):
         "name,obj,description,ui_units,display_units,rounding,is_input,input_category,is_output,output_category",
         f"feed,{obj},feed flow volume,{units},m^3/s,3,TRUE,something,FALSE,",
     ]
-    for row in rows:
-        f.write(row)
-        f.write("\n")
+    f.write("\n".join(rows) + "\n")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "bad_obj,bad_units", [(False, False), (True, False), (False, True)]
+)
+@pytest.mark.parametrize("export_func", [csv_from_tempfile, csv_from_localfile])
+def test_csv_exports(bad_obj, bad_units, export_func):
+    CSVTestSettings.bad_obj = bad_obj
+    CSVTestSettings.bad_units = bad_units
+    fsi = fsapi.FlowsheetInterface(
+        do_build=build_ro, do_solve=solve_ro, do_export=export_func
+    )
+    if bad_obj or bad_units:
+        # expect failure (bad_units or bad_obj)
+        with pytest.raises(RuntimeError):
+            fsi.build()
+    else:
+        fsi.build()  # expect success
 
 
 @pytest.mark.unit
@@ -390,13 +388,13 @@ def test_has_version():
 
 
 @pytest.mark.unit
-def test_to_csv(tmpdir):
+def test_to_csv(tmp_path):
     fsi = flowsheet_interface()
     fsi.build()
     outputs = [
-        tmpdir / "path.csv",
-        str(tmpdir / "filename.csv"),
-        open(tmpdir / "fileobj.csv", "w"),
+        tmp_path / "path.csv",
+        str(tmp_path / "filename.csv"),
+        open(tmp_path / "fileobj.csv", "w"),
     ]
     for o in outputs:
         num = fsi.fs_exp.to_csv(o)
@@ -404,7 +402,7 @@ def test_to_csv(tmpdir):
 
 
 @pytest.mark.unit
-def test_add_option(tmpdir):
+def test_add_option():
     fsi = flowsheet_interface()
     fsi.build()
     fsi.fs_exp.add_option(